@@ -5,34 +5,61 @@ Pulls all players who have played at least a specified number of minutes in the
 """
 
 import argparse
+import logging
 import sys
 from pathlib import Path
 from datetime import datetime
 
 try:
     from nba_api.stats.endpoints import leaguedashplayerstats
+    import numpy as np
     import pandas as pd
 except ImportError:
     print("Error: Required packages not installed. Run: pip install -r requirements.txt")
     sys.exit(1)
 
+from nba_export import write_csv, write_feather, write_json, write_ndjson
+from nba_http import configure_session
 
-def fetch_player_stats(season="2024-25", min_minutes=15.0, output_format="json", output_dir="data"):
+logger = logging.getLogger(__name__)
+
+# Columns written to the output file unless --columns says otherwise
+DEFAULT_COLUMNS = [
+    'PLAYER_ID', 'PLAYER_NAME', 'TEAM_ID', 'TEAM_ABBREVIATION', 'AGE', 'GP', 'MIN',
+    'PTS', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'FG_PCT', 'FG3_PCT', 'FT_PCT',
+]
+
+
+class _CliFormatter(logging.Formatter):
+    """Print progress messages bare and label everything else with its level."""
+
+    def format(self, record):
+        message = super().format(record)
+        if record.levelno == logging.INFO:
+            return message
+        return f"{record.levelname.capitalize()}: {message}"
+
+
+def fetch_player_stats(season="2024-25", min_minutes=15.0, output_format="json", output_dir="data",
+                       columns=None, pretty=False):
     """
     Fetch player statistics for players with minimum game time.
 
     Args:
         season: NBA season (e.g., "2024-25")
         min_minutes: Minimum minutes played (total across all games)
-        output_format: "json" or "csv"
+        output_format: "json", "ndjson", "csv" or "feather"
         output_dir: Directory to save output files
+        columns: Columns to include in the saved file, None for all columns
+        pretty: Indent JSON output for readability
     """
-    print(f"Fetching player stats for {season} season...")
-    print(f"Filter: Players with at least {min_minutes} total minutes played")
-    print("-" * 70)
+    logger.info("Fetching player stats for %s season...", season)
+    logger.info("Filter: Players with at least %s total minutes played", min_minutes)
+    logger.info("-" * 70)
 
     try:
         # Fetch player stats from the API
+        configure_session(season)
         player_stats = leaguedashplayerstats.LeagueDashPlayerStats(
             season=season,
             season_type_all_star="Regular Season",  # Regular Season, Playoffs, All Star
@@ -43,21 +70,32 @@ def fetch_player_stats(season="2024-25", min_minutes=15.0, output_format="json",
         # Get the data as a DataFrame
         df = player_stats.get_data_frames()[0]
 
-        print(f"✓ Retrieved {len(df)} total players from API")
+        logger.info("✓ Retrieved %d total players from API", len(df))
 
         # Filter by minimum minutes (MIN column contains total minutes)
         if 'MIN' in df.columns:
-            # Convert MIN to float if it's not already
-            df['MIN'] = pd.to_numeric(df['MIN'], errors='coerce')
-            df_filtered = df[df['MIN'] >= min_minutes].copy()
+            # Convert MIN to float if it's not already; coerce only if a plain cast fails
+            try:
+                df['MIN'] = df['MIN'].astype(np.float64)
+            except (TypeError, ValueError):
+                df['MIN'] = pd.to_numeric(df['MIN'], errors='coerce')
+            df_filtered = df.take(np.flatnonzero(df['MIN'].to_numpy() >= min_minutes))
         else:
-            print("Warning: MIN column not found, returning all players")
-            df_filtered = df.copy()
+            logger.warning("MIN column not found, returning all players")
+            df_filtered = df
 
         # Sort by minutes played (descending)
         df_filtered = df_filtered.sort_values('MIN', ascending=False)
 
-        print(f"✓ Filtered to {len(df_filtered)} players with >={min_minutes} minutes")
+        logger.info("✓ Filtered to %d players with >=%s minutes", len(df_filtered), min_minutes)
+
+        # Keep only the requested columns in the saved file
+        df_output = df_filtered
+        if columns is not None:
+            missing = [col for col in columns if col not in df_filtered.columns]
+            if missing:
+                logger.warning("Ignoring unknown columns: %s", ", ".join(missing))
+            df_output = df_filtered[[col for col in columns if col in df_filtered.columns]]
 
         # Create output directory if it doesn't exist
         output_path = Path(output_dir)
@@ -69,40 +107,48 @@ def fetch_player_stats(season="2024-25", min_minutes=15.0, output_format="json",
 
         if output_format == "json":
             filepath = output_path / f"{filename}.json"
-            df_filtered.to_json(filepath, orient="records", indent=2)
+            write_json(df_output, filepath, pretty=pretty)
+        elif output_format == "ndjson":
+            filepath = output_path / f"{filename}.ndjson"
+            write_ndjson(df_output, filepath)
         elif output_format == "csv":
             filepath = output_path / f"{filename}.csv"
-            df_filtered.to_csv(filepath, index=False)
+            write_csv(df_output, filepath)
+        elif output_format == "feather":
+            filepath = output_path / f"{filename}.feather"
+            write_feather(df_output, filepath)
         else:
             raise ValueError(f"Unsupported format: {output_format}")
 
-        print(f"✓ Saved to: {filepath}")
-        print()
+        logger.info("✓ Saved to: %s", filepath)
+        logger.info("")
 
         # Display summary statistics
-        print("Summary Statistics:")
-        print("-" * 70)
-        print(f"Total players: {len(df_filtered)}")
+        logger.info("Summary Statistics:")
+        logger.info("-" * 70)
+        logger.info("Total players: %d", len(df_filtered))
         if len(df_filtered) > 0:
-            print(f"Total minutes range: {df_filtered['MIN'].min():.1f} - {df_filtered['MIN'].max():.1f}")
-            print(f"Average minutes: {df_filtered['MIN'].mean():.1f}")
-            print()
-            print("Top 10 Players by Minutes Played:")
-            print("-" * 70)
+            logger.info("Total minutes range: %.1f - %.1f", df_filtered['MIN'].min(), df_filtered['MIN'].max())
+            logger.info("Average minutes: %.1f", df_filtered['MIN'].mean())
+            logger.info("")
+            logger.info("Top 10 Players by Minutes Played:")
+            logger.info("-" * 70)
             top_players = df_filtered.head(10)[['PLAYER_NAME', 'TEAM_ABBREVIATION', 'MIN', 'PTS', 'REB', 'AST']]
-            print(top_players.to_string(index=False))
+            logger.info("%s", top_players.to_string(index=False))
 
         return df_filtered
 
     except Exception as e:
-        print(f"Error fetching player stats: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception("Could not fetch player stats: %s", e)
         return None
 
 
 def main():
     """Main CLI entry point."""
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(_CliFormatter())
+    logging.basicConfig(level=logging.INFO, handlers=[handler])
+
     parser = argparse.ArgumentParser(
         description="Fetch NBA player statistics with minimum minutes filter"
     )
@@ -122,7 +168,7 @@ def main():
 
     parser.add_argument(
         "--format",
-        choices=["json", "csv"],
+        choices=["json", "ndjson", "csv", "feather"],
         default="json",
         help="Output format (default: json)"
     )
@@ -133,14 +179,33 @@ def main():
         help="Output directory for data (default: data)"
     )
 
+    parser.add_argument(
+        "--columns",
+        default=",".join(DEFAULT_COLUMNS),
+        help="Comma-separated columns to save, or 'all' (default: core box score columns)"
+    )
+
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output for readability"
+    )
+
     args = parser.parse_args()
 
+    if args.columns == "all":
+        columns = None
+    else:
+        columns = [col.strip() for col in args.columns.split(",") if col.strip()]
+
     # Fetch and save player stats
     fetch_player_stats(
         season=args.season,
         min_minutes=args.min_minutes,
         output_format=args.format,
-        output_dir=args.output_dir
+        output_dir=args.output_dir,
+        columns=columns,
+        pretty=args.pretty
     )
 
 
@@ -0,0 +1,120 @@
+"""
+Shared DataFrame export helpers for the NBA scripts.
+Uses orjson (or ujson) for JSON output when available.
+"""
+
+import math
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+CSV_CHUNKSIZE = 1000
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
+
+
+def _format_datetimes(df):
+    """Render datetime columns as ISO 8601 strings so every JSON encoder agrees."""
+    columns = df.select_dtypes(include=["datetime", "datetimetz"]).columns
+    if len(columns) == 0:
+        return df
+    return df.assign(**{col: df[col].dt.strftime(DATETIME_FORMAT) for col in columns})
+
+
+def _encode_record(record, pretty):
+    """Encode one record as JSON bytes with the fastest available library."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(record, option=option)
+
+    # ujson writes NaN as a bare token; emit null like pandas and orjson do
+    record = {
+        key: None if isinstance(value, float) and math.isnan(value) else value
+        for key, value in record.items()
+    }
+    return ujson.dumps(record, indent=2 if pretty else 0).encode()
+
+
+def write_json(df, filepath, pretty=False):
+    """
+    Write a DataFrame to a JSON file as a list of records.
+
+    Records are encoded and written one row at a time, so the full JSON
+    document is never held in memory. Compact output puts one record per
+    line.
+
+    Args:
+        df: DataFrame to write
+        filepath: Destination path
+        pretty: Indent each record for human reading
+    """
+    df = _format_datetimes(df)
+    if orjson is None and ujson is None:
+        df.to_json(filepath, orient="records", indent=2 if pretty else None)
+        return
+
+    columns = list(df.columns)
+
+    with open(filepath, "wb") as f:
+        f.write(b"[")
+        for i, values in enumerate(df.itertuples(index=False, name=None)):
+            f.write(b",\n" if i else b"\n")
+            f.write(_encode_record(dict(zip(columns, values)), pretty))
+        f.write(b"\n]")
+
+
+def write_ndjson(df, filepath):
+    """
+    Write a DataFrame as newline-delimited JSON, one record per line.
+
+    Unlike write_json the file has no enclosing array, so readers can
+    stream it line by line (e.g. pd.read_json(path, lines=True)).
+
+    Args:
+        df: DataFrame to write
+        filepath: Destination path
+    """
+    df = _format_datetimes(df)
+    if orjson is None and ujson is None:
+        df.to_json(filepath, orient="records", lines=True)
+        return
+
+    columns = list(df.columns)
+
+    with open(filepath, "wb") as f:
+        for values in df.itertuples(index=False, name=None):
+            f.write(_encode_record(dict(zip(columns, values)), False))
+            f.write(b"\n")
+
+
+def write_csv(df, filepath):
+    """
+    Write a DataFrame to a CSV file in batches of rows.
+
+    Args:
+        df: DataFrame to write
+        filepath: Destination path
+    """
+    df.to_csv(filepath, index=False, chunksize=CSV_CHUNKSIZE)
+
+
+def write_feather(df, filepath):
+    """
+    Write a DataFrame to a Feather (Arrow IPC) file.
+
+    Feather requires a default index, so filtered frames are reindexed.
+
+    Args:
+        df: DataFrame to write
+        filepath: Destination path
+    """
+    df.reset_index(drop=True).to_feather(filepath)
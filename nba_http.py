@@ -0,0 +1,102 @@
+"""
+Shared HTTP session setup for nba_api requests.
+Caches stats.nba.com responses on disk so repeat runs skip the network,
+and retries rate-limited or failed requests with backoff.
+"""
+
+from datetime import datetime
+
+
+CACHE_NAME = "nba_api_cache"
+CURRENT_SEASON_TTL = 3600  # seconds
+
+# Request headers stripped before the cache sees them (compared lowercased)
+NO_CACHE_HEADERS = frozenset(["cache-control", "pragma"])
+
+# Session installed into nba_api by configure_session
+_session = None
+
+
+def current_season(today=None):
+    """Return the season in progress on the given date (e.g. "2024-25")."""
+    today = today or datetime.now()
+    start_year = today.year if today.month >= 10 else today.year - 1
+    return f"{start_year}-{(start_year + 1) % 100:02d}"
+
+
+def is_current_season(season):
+    """Return True if the season may still change (current or future)."""
+    return season >= current_season()
+
+
+def _create_session():
+    """Return a (cached, if available) session that retries transient errors."""
+    from requests.adapters import HTTPAdapter
+    from urllib3.util import Retry
+
+    try:
+        import requests_cache
+    except ImportError:
+        import requests
+        session = requests.Session()
+    else:
+        class NbaCachedSession(requests_cache.CachedSession):
+            """CachedSession that ignores nba_api's no-cache request headers."""
+
+            def request(self, method, url, *args, headers=None, **kwargs):
+                # nba_api sends Cache-Control/Pragma: no-cache on every request,
+                # which would make requests-cache bypass every stored response
+                if headers:
+                    headers = {
+                        key: value for key, value in headers.items()
+                        if key.lower() not in NO_CACHE_HEADERS
+                    }
+                return super().request(method, url, *args, headers=headers, **kwargs)
+
+        session = NbaCachedSession(
+            CACHE_NAME,
+            backend="sqlite",
+            allowable_methods=("GET",),
+            stale_if_error=True
+        )
+
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        allowed_methods=frozenset(["GET"])
+    )
+    session.mount("https://", HTTPAdapter(max_retries=retry))
+    return session
+
+
+def configure_session(season):
+    """
+    Route nba_api requests through the shared session.
+
+    Historical seasons never change, so their responses are kept forever;
+    the current season expires after an hour. If a refresh fails, the
+    expired copy is served instead. Without requests-cache installed,
+    requests still get retries but are not cached.
+
+    Args:
+        season: NBA season the upcoming requests are for (e.g., "2023-24")
+    """
+    global _session
+
+    if _session is None:
+        from nba_api.stats.library.http import NBAStatsHTTP
+
+        _session = _create_session()
+        NBAStatsHTTP.set_session(_session)
+
+    try:
+        from requests_cache import NEVER_EXPIRE
+    except ImportError:
+        return
+
+    if is_current_season(season):
+        _session.settings.expire_after = CURRENT_SEASON_TTL
+    else:
+        _session.settings.expire_after = NEVER_EXPIRE
@@ -5,35 +5,69 @@ Scrapes historical NBA data including games, players, and team statistics.
 """
 
 import argparse
+import functools
+import hashlib
 import json
+import os
 import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+# Endpoint modules and pandas are imported where they are used, so that
+# list-teams and search-player start without loading them.
 try:
-    from nba_api.stats.endpoints import (
-        leaguegamefinder,
-        commonallplayers,
-        playergamelog,
-        teamgamelog,
-        boxscoretraditionalv2,
-        leaguestandings,
-    )
     from nba_api.stats.static import teams, players
 except ImportError:
     print("Error: nba_api not installed. Run: pip install -r requirements.txt")
     sys.exit(1)
 
-import pandas as pd
+from nba_export import write_csv, write_feather, write_json, write_ndjson
+from nba_http import configure_session, is_current_season
+
+
+# Bulk scraping stays well inside stats.nba.com's informal rate limit
+BATCH_MAX_WORKERS = 3
+BATCH_REQUEST_DELAY = 0.6  # seconds each worker waits between requests
+
+
+@functools.lru_cache(maxsize=1)
+def _cached_teams():
+    return tuple(teams.get_teams())
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_players(name_key):
+    return tuple(players.find_players_by_full_name(name_key))
+
+
+def _get_all_teams():
+    """Return all NBA teams, loaded once per process."""
+    # Hand out copies so callers can't alter the cached entries
+    return [dict(team) for team in _cached_teams()]
+
+
+def _find_players(name_key):
+    """Return players matching a normalized (stripped, lowercased) name."""
+    return [dict(player) for player in _cached_players(name_key)]
 
 
 class NbaScraper:
     """NBA data scraper using the nba_api library."""
 
-    def __init__(self, output_dir="data"):
-        """Initialize scraper with output directory."""
+    def __init__(self, output_dir="data", pretty=False):
+        """Initialize scraper with output directory and JSON formatting."""
         self.output_dir = Path(output_dir)
-        self.output_dir.mkdir(exist_ok=True)
+        self.pretty = pretty
+        os.makedirs(self.output_dir, exist_ok=True)
+        self.cache_dir = self.output_dir / ".cache"
+        # Prebuilt prefix for output file paths, reused by every _save_data call
+        self._output_prefix = f"{self.output_dir}{os.sep}"
+        # Per-thread record of whether the last _cached_fetch called the API
+        self._fetch_state = threading.local()
 
     def scrape_games(self, season="2023-24", team_abbr=None, output_format="json"):
         """
@@ -42,16 +76,20 @@ class NbaScraper:
         Args:
             season: NBA season (e.g., "2023-24")
             team_abbr: Team abbreviation (e.g., "LAL" for Lakers), None for all teams
-            output_format: "json" or "csv"
+            output_format: "json", "ndjson", "csv" or "feather"
         """
         print(f"Fetching games for {season} season...")
 
         try:
-            game_finder = leaguegamefinder.LeagueGameFinder(
-                season_nullable=season,
-                league_id_nullable="00"  # NBA
+            from nba_api.stats.endpoints import leaguegamefinder
+            configure_session(season)
+            games_df = self._cached_fetch(
+                ("leaguegamefinder", season),
+                lambda: leaguegamefinder.LeagueGameFinder(
+                    season_nullable=season,
+                    league_id_nullable="00"  # NBA
+                ).get_data_frames()[0]
             )
-            games_df = game_finder.get_data_frames()[0]
 
             if team_abbr:
                 games_df = games_df[games_df['TEAM_ABBREVIATION'] == team_abbr]
@@ -73,17 +111,21 @@ class NbaScraper:
 
         Args:
             season: NBA season (e.g., "2023-24")
-            output_format: "json" or "csv"
+            output_format: "json", "ndjson", "csv" or "feather"
         """
         print(f"Fetching players for {season} season...")
 
         try:
-            all_players = commonallplayers.CommonAllPlayers(
-                is_only_current_season=0,
-                league_id="00",
-                season=season
+            from nba_api.stats.endpoints import commonallplayers
+            configure_session(season)
+            players_df = self._cached_fetch(
+                ("commonallplayers", season),
+                lambda: commonallplayers.CommonAllPlayers(
+                    is_only_current_season=0,
+                    league_id="00",
+                    season=season
+                ).get_data_frames()[0]
             )
-            players_df = all_players.get_data_frames()[0]
 
             filename = f"players_{season}"
             self._save_data(players_df, filename, output_format)
@@ -101,16 +143,20 @@ class NbaScraper:
         Args:
             player_id: NBA player ID
             season: NBA season (e.g., "2023-24")
-            output_format: "json" or "csv"
+            output_format: "json", "ndjson", "csv" or "feather"
         """
         print(f"Fetching stats for player {player_id} in {season}...")
 
         try:
-            player_log = playergamelog.PlayerGameLog(
-                player_id=player_id,
-                season=season
+            from nba_api.stats.endpoints import playergamelog
+            configure_session(season)
+            stats_df = self._cached_fetch(
+                ("playergamelog", season, player_id),
+                lambda: playergamelog.PlayerGameLog(
+                    player_id=player_id,
+                    season=season
+                ).get_data_frames()[0]
             )
-            stats_df = player_log.get_data_frames()[0]
 
             filename = f"player_{player_id}_{season}"
             self._save_data(stats_df, filename, output_format)
@@ -121,6 +167,35 @@ class NbaScraper:
             print(f"Error scraping player stats: {e}")
             return None
 
+    def scrape_players_batch(self, player_ids, season="2023-24", output_format="json"):
+        """
+        Scrape game logs for several players concurrently.
+
+        Args:
+            player_ids: List of NBA player IDs
+            season: NBA season (e.g., "2023-24")
+            output_format: "json", "ndjson", "csv" or "feather"
+
+        Returns:
+            Dict mapping each player ID to its game log (None if it failed)
+        """
+        def scrape(player_id):
+            self._fetch_state.called_api = False
+            stats_df = self.scrape_player_stats(player_id, season, output_format)
+            # Only pace requests that went to the API, not local cache hits
+            if self._fetch_state.called_api:
+                time.sleep(BATCH_REQUEST_DELAY)
+            return stats_df
+
+        # Set up the shared session before workers start using it
+        configure_session(season)
+
+        # Duplicate IDs would fetch and write the same file concurrently
+        unique_ids = list(dict.fromkeys(player_ids))
+
+        with ThreadPoolExecutor(max_workers=BATCH_MAX_WORKERS) as executor:
+            return dict(zip(unique_ids, executor.map(scrape, unique_ids)))
+
     def scrape_team_stats(self, team_id, season="2023-24", output_format="json"):
         """
         Scrape game log for a specific team.
@@ -128,16 +203,20 @@ class NbaScraper:
         Args:
             team_id: NBA team ID
             season: NBA season (e.g., "2023-24")
-            output_format: "json" or "csv"
+            output_format: "json", "ndjson", "csv" or "feather"
         """
         print(f"Fetching stats for team {team_id} in {season}...")
 
         try:
-            team_log = teamgamelog.TeamGameLog(
-                team_id=team_id,
-                season=season
+            from nba_api.stats.endpoints import teamgamelog
+            configure_session(season)
+            stats_df = self._cached_fetch(
+                ("teamgamelog", season, team_id),
+                lambda: teamgamelog.TeamGameLog(
+                    team_id=team_id,
+                    season=season
+                ).get_data_frames()[0]
             )
-            stats_df = team_log.get_data_frames()[0]
 
             filename = f"team_{team_id}_{season}"
             self._save_data(stats_df, filename, output_format)
@@ -154,16 +233,20 @@ class NbaScraper:
 
         Args:
             season: NBA season (e.g., "2023-24")
-            output_format: "json" or "csv"
+            output_format: "json", "ndjson", "csv" or "feather"
         """
         print(f"Fetching standings for {season} season...")
 
         try:
-            standings = leaguestandings.LeagueStandings(
-                league_id="00",
-                season=season
+            from nba_api.stats.endpoints import leaguestandings
+            configure_session(season)
+            standings_df = self._cached_fetch(
+                ("leaguestandings", season),
+                lambda: leaguestandings.LeagueStandings(
+                    league_id="00",
+                    season=season
+                ).get_data_frames()[0]
             )
-            standings_df = standings.get_data_frames()[0]
 
             filename = f"standings_{season}"
             self._save_data(standings_df, filename, output_format)
@@ -176,7 +259,7 @@ class NbaScraper:
 
     def list_teams(self):
         """List all NBA teams with their IDs and abbreviations."""
-        all_teams = teams.get_teams()
+        all_teams = _get_all_teams()
         print("\nAvailable NBA Teams:")
         print("-" * 60)
         for team in all_teams:
@@ -185,7 +268,7 @@ class NbaScraper:
 
     def search_player(self, player_name):
         """Search for a player by name."""
-        all_players = players.find_players_by_full_name(player_name)
+        all_players = _find_players(player_name.strip().lower())
 
         if not all_players:
             print(f"No players found matching '{player_name}'")
@@ -198,14 +281,64 @@ class NbaScraper:
 
         return all_players
 
+    def _cached_fetch(self, key, fetcher):
+        """
+        Return an API result, reusing a local copy for historical seasons.
+
+        Args:
+            key: Tuple of (endpoint_name, season, *params) identifying the request
+            fetcher: Callable that fetches the DataFrame from the API
+        """
+        def fetch():
+            self._fetch_state.called_api = True
+            return fetcher()
+
+        season = key[1]
+        if is_current_season(season):
+            return fetch()
+
+        digest = hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+        cache_path = self.cache_dir / f"{digest}.feather"
+        if cache_path.exists():
+            import pandas as pd
+            try:
+                return pd.read_feather(cache_path)
+            except Exception:
+                # Unreadable cache file: drop it and fetch again
+                cache_path.unlink(missing_ok=True)
+
+        df = fetch()
+
+        # Write to a temp file first so an interrupted write never leaves a
+        # truncated file at the cache path. The cache is only an optimization,
+        # so a failed write is reported and the fetched data returned anyway.
+        tmp_path = None
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            os.close(fd)
+            write_feather(df, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            print(f"Warning: Could not cache {key[0]} results: {e}")
+        return df
+
     def _save_data(self, df, filename, output_format):
         """Save DataFrame to file in specified format."""
         if output_format == "json":
-            filepath = self.output_dir / f"{filename}.json"
-            df.to_json(filepath, orient="records", indent=2)
+            filepath = f"{self._output_prefix}{filename}.json"
+            write_json(df, filepath, pretty=self.pretty)
+        elif output_format == "ndjson":
+            filepath = f"{self._output_prefix}{filename}.ndjson"
+            write_ndjson(df, filepath)
         elif output_format == "csv":
-            filepath = self.output_dir / f"{filename}.csv"
-            df.to_csv(filepath, index=False)
+            filepath = f"{self._output_prefix}{filename}.csv"
+            write_csv(df, filepath)
+        elif output_format == "feather":
+            filepath = f"{self._output_prefix}{filename}.feather"
+            write_feather(df, filepath)
         else:
             raise ValueError(f"Unsupported format: {output_format}")
 
@@ -254,7 +387,7 @@ def main():
 
     parser.add_argument(
         "--format",
-        choices=["json", "csv"],
+        choices=["json", "ndjson", "csv", "feather"],
         default="json",
         help="Output format (default: json)"
     )
@@ -265,9 +398,15 @@ def main():
         help="Output directory for scraped data (default: data)"
     )
 
+    parser.add_argument(
+        "--pretty",
+        action="store_true",
+        help="Indent JSON output for readability"
+    )
+
     args = parser.parse_args()
 
-    scraper = NbaScraper(output_dir=args.output_dir)
+    scraper = NbaScraper(output_dir=args.output_dir, pretty=args.pretty)
 
     # Execute command
     if args.command == "games":
@@ -0,0 +1,93 @@
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import nba_export
+
+ENCODERS = ["orjson", "ujson", "pandas"]
+
+
+@pytest.fixture(params=ENCODERS)
+def encoder(request, monkeypatch):
+    """Force write_json/write_ndjson onto one encoder path."""
+    if request.param in ("orjson", "ujson") and getattr(nba_export, request.param) is None:
+        pytest.skip(f"{request.param} not installed")
+    if request.param != "orjson":
+        monkeypatch.setattr(nba_export, "orjson", None)
+    if request.param != "ujson":
+        monkeypatch.setattr(nba_export, "ujson", None)
+    return request.param
+
+
+@pytest.fixture
+def players_df():
+    return pd.DataFrame({
+        "PLAYER_ID": [1, 2, 3],
+        "PLAYER_NAME": ["Nikola Jokić", "Luka Dončić", "Giannis Antetokounmpo"],
+        "MIN": [2345.5, np.nan, 30.0],
+        "GAME_DATE": pd.to_datetime(["2024-01-01 00:00", None, "2024-03-15 19:30"]),
+    })
+
+
+EXPECTED = [
+    {"PLAYER_ID": 1, "PLAYER_NAME": "Nikola Jokić", "MIN": 2345.5,
+     "GAME_DATE": "2024-01-01T00:00:00"},
+    {"PLAYER_ID": 2, "PLAYER_NAME": "Luka Dončić", "MIN": None, "GAME_DATE": None},
+    {"PLAYER_ID": 3, "PLAYER_NAME": "Giannis Antetokounmpo", "MIN": 30.0,
+     "GAME_DATE": "2024-03-15T19:30:00"},
+]
+
+
+@pytest.mark.parametrize("pretty", [False, True])
+def test_write_json_round_trip(encoder, players_df, tmp_path, pretty):
+    path = tmp_path / "out.json"
+    nba_export.write_json(players_df, path, pretty=pretty)
+
+    text = path.read_text(encoding="utf-8")
+    assert json.loads(text) == EXPECTED
+    assert "NaN" not in text
+    assert ("\n  " in text) == pretty
+
+
+def test_write_json_empty_frame(encoder, tmp_path):
+    path = tmp_path / "out.json"
+    nba_export.write_json(pd.DataFrame({"PLAYER_ID": []}), path)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == []
+
+
+def test_write_json_filtered_frame_ignores_index(encoder, players_df, tmp_path):
+    path = tmp_path / "out.json"
+    nba_export.write_json(players_df.iloc[[2, 0]], path)
+
+    assert json.loads(path.read_text(encoding="utf-8")) == [EXPECTED[2], EXPECTED[0]]
+
+
+def test_write_ndjson_round_trip(encoder, players_df, tmp_path):
+    path = tmp_path / "out.ndjson"
+    nba_export.write_ndjson(players_df, path)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == EXPECTED
+
+    df = pd.read_json(path, lines=True, convert_dates=False)
+    assert df["PLAYER_NAME"].tolist() == players_df["PLAYER_NAME"].tolist()
+    assert df["MIN"].isna().tolist() == [False, True, False]
+
+
+def test_write_ndjson_empty_frame(encoder, tmp_path):
+    path = tmp_path / "out.ndjson"
+    nba_export.write_ndjson(pd.DataFrame({"PLAYER_ID": []}), path)
+
+    assert path.read_text(encoding="utf-8").strip() == ""
+
+
+def test_unsupported_type_is_not_stringified(tmp_path):
+    if nba_export.orjson is None and nba_export.ujson is None:
+        pytest.skip("no fast JSON encoder installed")
+    df = pd.DataFrame({"VALUE": [object()]})
+
+    with pytest.raises(TypeError):
+        nba_export.write_json(df, tmp_path / "out.json")
@@ -0,0 +1,104 @@
+import io
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from nba_api.stats.library.http import NBAStatsHTTP
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+import nba_http
+
+BODY = {"resultSets": [{"name": "Standings", "headers": ["TeamID"], "rowSet": [[1]]}]}
+PARAMETERS = {"LeagueID": "00", "Season": "2019-20", "SeasonType": "Regular Season"}
+
+
+class StubAdapter(HTTPAdapter):
+    """Transport that answers every request locally and counts them."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+        self.status = 200
+        self.etag = None
+        self.if_none_match = []
+
+    def send(self, request, **kwargs):
+        self.calls += 1
+        self.if_none_match.append(request.headers.get("If-None-Match"))
+
+        headers = {"Content-Type": "application/json"}
+        if self.etag:
+            headers["ETag"] = self.etag
+
+        if self.etag and request.headers.get("If-None-Match") == self.etag:
+            status, body = 304, b""
+        elif self.status == 200:
+            status, body = 200, json.dumps(BODY).encode()
+        else:
+            status, body = self.status, json.dumps({"message": "error"}).encode()
+
+        raw = HTTPResponse(body=io.BytesIO(body), status=status, headers=headers,
+                           preload_content=False)
+        return self.build_response(request, raw)
+
+
+@pytest.fixture
+def stub(tmp_path, monkeypatch):
+    monkeypatch.setattr(nba_http, "CACHE_NAME", str(tmp_path / "cache"))
+    monkeypatch.setattr(nba_http, "_session", None)
+    monkeypatch.setattr(NBAStatsHTTP, "_session", None)
+
+    def configure(season):
+        nba_http.configure_session(season)
+        adapter = StubAdapter()
+        nba_http._session.mount("https://stats.nba.com/", adapter)
+        return adapter
+
+    return configure
+
+
+def send_request():
+    return NBAStatsHTTP().send_api_request(endpoint="leaguestandings", parameters=PARAMETERS)
+
+
+def test_nba_api_headers_request_no_cache():
+    headers = {key.lower(): value for key, value in NBAStatsHTTP.headers.items()}
+    assert headers.get("cache-control") == "no-cache"
+
+
+def test_repeat_request_served_from_cache(stub):
+    adapter = stub("2019-20")
+
+    assert send_request().get_dict() == BODY
+    assert send_request().get_dict() == BODY
+    assert adapter.calls == 1
+
+    response = nba_http._session.get(
+        "https://stats.nba.com/stats/leaguestandings",
+        params=sorted(PARAMETERS.items()),
+        headers=NBAStatsHTTP.headers,
+    )
+    assert response.from_cache
+
+
+def test_expired_response_served_when_refresh_fails(stub):
+    adapter = stub(nba_http.current_season())
+    assert send_request().get_dict() == BODY
+
+    nba_http._session.cache.reset_expiration(datetime.now(timezone.utc) - timedelta(seconds=1))
+    adapter.status = 500
+
+    assert send_request().get_dict() == BODY
+    assert adapter.calls == 2
+
+
+def test_expired_response_revalidated_with_etag(stub):
+    adapter = stub(nba_http.current_season())
+    adapter.etag = '"v1"'
+    assert send_request().get_dict() == BODY
+
+    nba_http._session.cache.reset_expiration(datetime.now(timezone.utc) - timedelta(seconds=1))
+
+    assert send_request().get_dict() == BODY
+    assert adapter.if_none_match == [None, '"v1"']
@@ -0,0 +1,115 @@
+import pandas as pd
+import pytest
+
+import scraper
+
+PAST_KEY = ("leaguestandings", "2019-20")
+
+
+@pytest.fixture
+def nba_scraper(tmp_path):
+    return scraper.NbaScraper(output_dir=tmp_path)
+
+
+def make_fetcher(calls):
+    def fetch():
+        calls.append(1)
+        return pd.DataFrame({"TeamID": [1, 2]})
+    return fetch
+
+
+def test_cached_fetch_reuses_past_season(nba_scraper):
+    calls = []
+    first = nba_scraper._cached_fetch(PAST_KEY, make_fetcher(calls))
+    second = nba_scraper._cached_fetch(PAST_KEY, make_fetcher(calls))
+
+    assert len(calls) == 1
+    pd.testing.assert_frame_equal(first, second)
+    assert [p.suffix for p in nba_scraper.cache_dir.iterdir()] == [".feather"]
+
+
+def test_cached_fetch_refetches_unreadable_file(nba_scraper):
+    calls = []
+    nba_scraper._cached_fetch(PAST_KEY, make_fetcher(calls))
+    (cache_path,) = nba_scraper.cache_dir.iterdir()
+    cache_path.write_bytes(cache_path.read_bytes()[:10])
+
+    df = nba_scraper._cached_fetch(PAST_KEY, make_fetcher(calls))
+
+    assert len(calls) == 2
+    assert df["TeamID"].tolist() == [1, 2]
+    pd.testing.assert_frame_equal(pd.read_feather(cache_path), df)
+
+
+def test_cached_fetch_failed_write_leaves_no_file(nba_scraper, monkeypatch):
+    def fail(df, filepath):
+        with open(filepath, "wb") as f:
+            f.write(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(scraper, "write_feather", fail)
+
+    df = nba_scraper._cached_fetch(PAST_KEY, make_fetcher([]))
+
+    assert df["TeamID"].tolist() == [1, 2]
+    assert list(nba_scraper.cache_dir.iterdir()) == []
+
+
+def test_scrape_succeeds_when_cache_write_fails(nba_scraper, monkeypatch):
+    mixed = pd.DataFrame({"TeamID": [1, 2], "Record": ["41-41", 50]})
+    monkeypatch.setattr(scraper, "configure_session", lambda season: None)
+
+    class Standings:
+        def __init__(self, **kwargs):
+            pass
+
+        def get_data_frames(self):
+            return [mixed]
+
+    monkeypatch.setattr("nba_api.stats.endpoints.leaguestandings.LeagueStandings", Standings)
+
+    df = nba_scraper.scrape_standings("2019-20", output_format="csv")
+
+    assert df is not None
+    assert (nba_scraper.output_dir / "standings_2019-20.csv").exists()
+    assert list(nba_scraper.cache_dir.iterdir()) == []
+
+
+def test_team_lookup_returns_independent_copies():
+    first = scraper._get_all_teams()
+    first[0]["abbreviation"] = "XXX"
+    first.clear()
+
+    second = scraper._get_all_teams()
+    assert second and second[0]["abbreviation"] != "XXX"
+
+
+def test_player_lookup_returns_independent_copies():
+    first = scraper._find_players("lebron james")
+    first[0]["full_name"] = "Someone Else"
+    first.append({})
+
+    second = scraper._find_players("lebron james")
+    assert [player["full_name"] for player in second] == ["LeBron James"]
+
+
+def test_players_batch_only_pauses_after_api_calls(nba_scraper, monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(scraper, "configure_session", lambda season: None)
+    monkeypatch.setattr(scraper.time, "sleep", sleeps.append)
+
+    class PlayerGameLog:
+        def __init__(self, player_id, season):
+            self.player_id = player_id
+
+        def get_data_frames(self):
+            return [pd.DataFrame({"Player_ID": [self.player_id], "PTS": [30]})]
+
+    monkeypatch.setattr("nba_api.stats.endpoints.playergamelog.PlayerGameLog", PlayerGameLog)
+
+    first = nba_scraper.scrape_players_batch([1, 2, 3], season="2019-20")
+    assert len(sleeps) == 3
+
+    second = nba_scraper.scrape_players_batch([1, 2, 3], season="2019-20")
+    assert len(sleeps) == 3
+    assert second[2]["PTS"].tolist() == first[2]["PTS"].tolist() == [30]